@@ -6,31 +6,143 @@ extrai pedidos (quantidade + sabor) e mantém um contexto simples de conversa.
 
 Observações
 ---------
-- Uso de NLTK para tokenização e stopwords.
+- Uso de NLTK para stopwords; a tokenização é feita com uma expressão regular.
 - Estrutura de intents esperada: {"intents": [{"tag": ..., "patterns": [...], "responses": [...]}]}
 - Estrutura do menu esperada: {"produtos": [{"nome": ..., "preco": ...}, ...]}
 """
 
-import json
+import os
 import random
 import re
+import sys
 import unicodedata
+from collections.abc import Callable
+from functools import lru_cache
 from string import punctuation
 
-try:
-    from nltk.corpus import stopwords  # type: ignore[import]
+import nltk  # type: ignore[import]
+
+
+def _has_nltk_resource(resource: str) -> bool:
+    """Indica se um recurso do NLTK (ex.: 'corpora/stopwords') já está instalado."""
+    try:
+        nltk.data.find(resource)
+    except LookupError:
+        return False
+    return True
 
-    stopwords.words('portuguese')
-    del stopwords
-except LookupError:
-    import nltk  # type: ignore[import]
 
+# Baixa apenas o que falta, sem abrir o corpus só para testar se ele existe
+if not _has_nltk_resource('corpora/stopwords'):
     nltk.download('stopwords', quiet=True)
-    nltk.download('punkt_tab', quiet=True)
-    del nltk
-finally:
-    from nltk.corpus import stopwords
-    from nltk.tokenize import word_tokenize  # type: ignore[import]
+
+from nltk.corpus import stopwords  # type: ignore[import]
+
+# Stopwords em português, carregadas uma única vez na importação do módulo
+_STOP_WORDS: frozenset[str] = frozenset(stopwords.words('portuguese'))
+# Palavras ignoradas ao extrair as keywords dos sabores do menu
+_FLAVOR_STOP_WORDS: frozenset[str] = _STOP_WORDS | {'bolo', 'bolos'}
+
+try:
+    from orjson import loads as json_loads  # type: ignore[import]
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
+
+try:
+    import ahocorasick  # type: ignore[import]
+except ImportError:
+    ahocorasick = None
+
+# Bytes dos arquivos JSON já lidos: caminho absoluto -> (mtime em ns, bytes)
+_JSON_CACHE: dict[str, tuple[int, bytes]] = {}
+
+# Números por extenso reconhecidos em extrair_quantidade
+_NUM_WORDS: dict[str, int] = {
+    'um': 1,
+    'uma': 1,
+    'dois': 2,
+    'duas': 2,
+    'tres': 3,
+    'quatro': 4,
+    'cinco': 5,
+    'seis': 6,
+    'sete': 7,
+    'oito': 8,
+    'nove': 9,
+    'dez': 10,
+    'onze': 11,
+    'doze': 12,
+    'treze': 13,
+    'quatorze': 14,
+    'catore': 14,
+    'quinze': 15,
+    'dezesseis': 16,
+    'dezessete': 17,
+    'dezoito': 18,
+    'dezenove': 19,
+    'vinte': 20,
+}
+
+# Expressões regulares pré-compiladas (evita o cache interno do `re` a cada mensagem)
+_RE_DIGITS: re.Pattern[str] = re.compile(r'\b(\d{1,2})\b')
+# Alternativas mais longas primeiro, para que "dezessete" tenha prioridade sobre "dez"
+_RE_NUM_WORDS: re.Pattern[str] = re.compile(
+    r'\b(' + '|'.join(sorted(_NUM_WORDS, key=len, reverse=True)) + r')\b'
+)
+_RE_WORD: re.Pattern[str] = re.compile(r'\w+')
+_RE_BOLO_DE: re.Pattern[str] = re.compile(r'\bbolos?\s+de\s+(.+)')
+# Marcas não espaçadoras (categoria Mn), ou seja, os acentos separados pela NFD
+_RE_MARKS: re.Pattern[str] = re.compile(
+    '['
+    + re.escape(
+        ''.join(
+            chr(i)
+            for i in range(sys.maxunicode + 1)
+            if unicodedata.category(chr(i)) == 'Mn'
+        )
+    )
+    + ']'
+)
+# Tudo que não é letra, dígito ou espaço
+_RE_NON_WORD: re.Pattern[str] = re.compile(r'[^\w\s]|_')
+
+# Métodos já ligados aos padrões usados a cada mensagem, poupando a busca do atributo
+_search_digits: Callable[[str], re.Match[str] | None] = _RE_DIGITS.search
+_search_num_words: Callable[[str], re.Match[str] | None] = _RE_NUM_WORDS.search
+_find_words: Callable[[str], list[str]] = _RE_WORD.findall
+_sub_marks: Callable[[str, str], str] = _RE_MARKS.sub
+_sub_non_word: Callable[[str, str], str] = _RE_NON_WORD.sub
+
+# Peso de cada keyword em comum na pontuação de extrair_sabor
+# TODO 3 é o melhor fator a ser utilizado?
+_KEYWORD_WEIGHT: int = 3
+
+# Tabela de tradução usada em normalize: remove pontuação e acentos e troca
+# caracteres de controle ASCII por espaço (como separadores de palavra) em uma
+# única passada
+_ACCENTED_CHARS: str = 'áàâãäåéèêëíìîïóòôõöúùûüýÿçñ'
+_ASCII_CONTROL_CHARS: str = ''.join(
+    chr(i) for i in (*range(32), 127) if not chr(i).isspace()
+)
+_NORMALIZE_TABLE: dict[int, int | str | None] = (
+    str.maketrans('', '', punctuation)
+    | {ord(c): ' ' for c in _ASCII_CONTROL_CHARS}
+    | {ord(c): ord(unicodedata.normalize('NFD', c)[0]) for c in _ACCENTED_CHARS}
+)
+
+
+@lru_cache(maxsize=2048)
+def _normalize(text: str) -> str:
+    """Implementação de ChatbotVoRomario.normalize, cacheada por texto."""
+    text = text.lower().translate(_NORMALIZE_TABLE)
+    if text.isascii():
+        return text
+
+    # Caracteres fora da tabela: recorre à normalização NFD completa, descartando
+    # os acentos (marcas Mn) e trocando pontuação, símbolos (ex.: "…", "—",
+    # emojis) e caracteres de controle por espaço, para que continuem separando
+    # as palavras
+    return _sub_non_word(' ', _sub_marks('', unicodedata.normalize('NFD', text)))
 
 
 class ChatbotVoRomario:
@@ -55,23 +167,88 @@ class ChatbotVoRomario:
         Dicionário que armazena o estado/contexto atual da conversa.
     """
 
+    # Conjunto fixo de atributos: dispensa o __dict__ por instância
+    __slots__ = (
+        '_intents',
+        'products',
+        '_flavor_index',
+        'data',
+        'context',
+        '_intents_by_tag',
+        '_token_to_intents',
+        '_responses_parsed',
+        '_keyword_bits',
+        '_phrase_automaton',
+        '_originals',
+        '_phrases',
+        '_keyword_masks',
+        '_max_scores',
+        '_score_order',
+    )
+
     def __init__(self) -> None:
         """Inicializa o ChatbotVoRomario.
 
         A inicialização realiza as seguintes ações:
-        - carrega as intents a partir de 'intents.json';
+        - carrega as intents a partir de 'intents.json', pré-processa seus patterns
+          e respostas e indexa as intents por tag e pelos tokens dos patterns;
         - carrega os produtos a partir de 'menu.json';
-        - constrói um índice de sabores a partir dos nomes dos produtos;
+        - constrói um índice de sabores a partir dos nomes dos produtos (e, a partir
+          dele, as estruturas de pontuação usadas por extrair_sabor);
         - prepara o dicionário `data` com a representação em texto do menu;
-        - inicializa o contexto da conversa;
-        - exibe a apresentação do bot (chama bot_presentation).
+        - inicializa o contexto da conversa.
+
+        A apresentação do bot não é exibida aqui; chame bot_presentation quando
+        for iniciar a conversa (como faz main()).
         """
-        self.intents: list[dict] = self.load_intents()
+        self.intents = self.load_intents()
         self.products: list[dict] = self.load_products()
-        self.flavor_index: list[dict] = self.build_flavor_index(self.products)
+        self.flavor_index = self.build_flavor_index(self.products)
         self.data: dict = {'menu': self.load_str_menu()}
         self.context: dict = {}
-        self.bot_presentation()
+
+    # ----------------------------
+    # Intents e estruturas derivadas
+    # ----------------------------
+    @property
+    def intents(self) -> list[dict]:
+        """Intents usadas por get_response.
+
+        Atribuir uma nova lista reconstrói as estruturas derivadas dela, mantendo
+        as duas coisas sempre sincronizadas.
+        """
+        return self._intents
+
+    @intents.setter
+    def intents(self, intents: list[dict]) -> None:
+        self._intents = intents
+        self._build_intent_structures(intents)
+
+    def _build_intent_structures(self, intents: list[dict]) -> None:
+        """Monta, a partir das intents, as estruturas usadas por get_response.
+
+        - `self._intents_by_tag`: intents indexadas pela tag
+        - `self._token_to_intents`: índice invertido token dos patterns -> posições
+          das intents que o contêm
+        - `self._responses_parsed`: respostas de cada intent marcadas com a
+          necessidade (ou não) de formatação com `data`, na mesma ordem das intents
+
+        Parameters
+        ----------
+        intents : list[dict]
+            Intents no formato de 'intents.json'.
+        """
+        self._intents_by_tag: dict[str, dict] = {i['tag']: i for i in intents}
+        self._token_to_intents: dict[str, list[int]] = {}
+        for i, intent in enumerate(intents):
+            for token in set(
+                self.preprocess_text(' '.join(intent.get('patterns', [])))
+            ):
+                self._token_to_intents.setdefault(token, []).append(i)
+        self._responses_parsed: tuple[tuple[tuple[str, bool], ...], ...] = tuple(
+            tuple((r, '{' in r or '}' in r) for r in intent['responses'])
+            for intent in intents
+        )
 
     # ----------------------------
     # Utilidades de dados/arquivos
@@ -79,6 +256,11 @@ class ChatbotVoRomario:
     def load_json(self, file_path: str) -> dict:
         """Abre um arquivo JSON e retorna seu conteúdo.
 
+        Usa o `orjson` quando disponível, caindo para o `json` da biblioteca padrão.
+        Os bytes do arquivo são cacheados por caminho e só são lidos novamente se a
+        data de modificação do arquivo mudar; cada chamada desserializa os bytes e
+        retorna objetos novos, que podem ser alterados livremente.
+
         Parameters
         ----------
         file_path : str
@@ -89,8 +271,16 @@ class ChatbotVoRomario:
         dict
             Conteúdo do arquivo JSON desserializado.
         """
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return json.load(file)
+        path: str = os.path.abspath(file_path)
+        mtime: int = os.stat(path).st_mtime_ns
+        cached: tuple[int, bytes] | None = _JSON_CACHE.get(path)
+        if cached is not None and cached[0] == mtime:
+            raw: bytes = cached[1]
+        else:
+            with open(path, 'rb') as file:
+                raw = file.read()
+            _JSON_CACHE[path] = (mtime, raw)
+        return json_loads(raw)
 
     def load_intents(self, intents_file_path: str = 'intents.json') -> list[dict]:
         """Carrega intents a partir de um arquivo JSON.
@@ -131,37 +321,30 @@ class ChatbotVoRomario:
         str
             Texto formatado contendo o nome e preço de cada produto.
         """
-        string_menu = '\n'.join(
-            [f'{b['nome']} - R${b['preco']:.2f}' for b in self.products]
+        return '🍰 *MENU VÔ ROMÁRIO* 🍰\n' + '\n'.join(
+            f'{b['nome']} - R${b['preco']:.2f}' for b in self.products
         )
-        return f'🍰 *MENU VÔ ROMÁRIO* 🍰\n{string_menu}'
 
     # ----------------------------
     # Normalização e NLP simples
     # ----------------------------
     # TODO Crie as docstrings de todos os métodos/funções daqui pra baixo
-    @property
-    def stop_words(self) -> set[str]:
-        """Conjunto de stopwords em português.
-
-        O resultado é cacheado no atributo privado _stop_words na primeira chamada.
-
-        Returns
-        -------
-        set[str]
-            Conjunto de palavras a serem ignoradas durante o pré-processamento.
-        """
-        if not hasattr(self, '_stop_words'):
-            self._stop_words: set[str] = set(stopwords.words('portuguese'))
-        return self._stop_words
-
-    def normalize(self, text: str) -> str:
+    @staticmethod
+    def normalize(text: str) -> str:
         """Normaliza o texto para facilitar comparação.
 
         Operações realizadas:
         - converte para minúsculas
-        - remove pontuação
-        - remove acentuação (normalização Unicode NFD e remoção de marcas)
+        - remove pontuação ASCII; pontuação e símbolos Unicode (ex.: "…", "—",
+          emojis) viram espaços, separando as palavras
+        - remove acentuação (tabela de tradução pré-calculada; normalização Unicode
+          NFD e remoção de marcas apenas para caracteres fora da tabela)
+
+        O resultado contém apenas letras, dígitos e espaços, podendo ser dividido
+        em palavras com `str.split`.
+
+        Os resultados são cacheados (LRU), pois o mesmo texto é normalizado por
+        várias etapas do processamento de uma mensagem.
 
         Parameters
         ----------
@@ -173,14 +356,7 @@ class ChatbotVoRomario:
         str
             Texto normalizado.
         """
-        text = text.lower()
-        text = text.translate(str.maketrans('', '', punctuation))
-        text = ''.join(
-            c
-            for c in unicodedata.normalize('NFD', text)
-            if unicodedata.category(c) != 'Mn'
-        )
-        return text
+        return _normalize(text)
 
     def preprocess_text(self, text: str) -> list[str]:
         """Tokeniza e remove stopwords de uma string normalizada.
@@ -195,13 +371,41 @@ class ChatbotVoRomario:
         list[str]
             Lista de tokens úteis (sem stopwords).
         """
-        tokens: list[str] = word_tokenize(self.normalize(text), language='portuguese')
-        result: list[str] = [word for word in tokens if word not in self.stop_words]
-        return result
+        return self._tokens_from_norm(_normalize(text))
+
+    def _tokens_from_norm(self, text_norm: str) -> list[str]:
+        """Tokeniza e remove stopwords de um texto já normalizado.
+
+        Parameters
+        ----------
+        text_norm : str
+            Texto já normalizado (resultado de normalize()).
+
+        Returns
+        -------
+        list[str]
+            Lista de tokens úteis (sem stopwords).
+        """
+        # Tokenização e filtro de stopwords em uma só expressão
+        return [word for word in _find_words(text_norm) if word not in _STOP_WORDS]
 
     # ----------------------------
     # Índice de sabores a partir do menu
     # ----------------------------
+    @property
+    def flavor_index(self) -> list[dict]:
+        """Índice de sabores (ver build_flavor_index) usado por extrair_sabor.
+
+        Atribuir um novo índice reconstrói as estruturas de pontuação derivadas dele,
+        mantendo as duas coisas sempre sincronizadas.
+        """
+        return self._flavor_index
+
+    @flavor_index.setter
+    def flavor_index(self, index: list[dict]) -> None:
+        self._flavor_index = index
+        self._build_scoring_structures(index)
+
     def build_flavor_index(self, products: list[dict]) -> list[dict]:
         """Cria um índice de sabores a partir dos nomes dos produtos.
 
@@ -210,6 +414,9 @@ class ChatbotVoRomario:
         - 'phrase': parte relevante do nome (normalizada), por exemplo a parte após "bolo(s) de"
         - 'keywords': conjunto de palavras-chave extraídas da phrase (stopwords removidas)
 
+        O método não altera o estado do bot; as estruturas de pontuação derivadas
+        do índice são montadas ao atribuí-lo a `flavor_index`.
+
         Parameters
         ----------
         products : list[dict]
@@ -233,27 +440,102 @@ class ChatbotVoRomario:
             norm_name: str = self.normalize(original_name)
 
             # tenta extrair a parte depois de "bolo(s) de "
-            # TODO Incluir type hint
-            m = re.search(r'\bbolos?\s+de\s+(.+)', norm_name)
+            m: re.Match[str] | None = _RE_BOLO_DE.search(norm_name)
             phrase: str = m.group(1).strip() if m else norm_name
 
             # keywords = tokens da frase sem stopwords comuns
-            tokens = [
-                t
-                for t in re.findall(r'\w+', phrase)
-                if t not in self.stop_words and t not in {'bolo', 'bolos'}
-            ]
+            tokens = [t for t in phrase.split() if t not in _FLAVOR_STOP_WORDS]
             index.append(
                 {
                     'original': original_name,  # Nome visível no menu
                     'phrase': phrase,  # Frase (normalizada) que descreve o sabor
-                    'keywords': set(
+                    'keywords': frozenset(
                         tokens
                     ),  # Palavras-chave para "casar" com o texto do cliente
                 }
             )
+
         return index
 
+    def _build_scoring_structures(self, index: list[dict]) -> None:
+        """Monta, a partir do índice de sabores, as estruturas usadas na pontuação.
+
+        - `self._keyword_bits`: posição de bit de cada keyword do menu
+        - `self._phrase_automaton`: autômato Aho–Corasick das phrases (se o
+          `pyahocorasick` estiver instalado), usado por match_phrases
+        - `self._originals`, `self._phrases`, `self._keyword_masks`: campos de cada
+          item em sequências paralelas, percorridas por extrair_sabor
+        - `self._max_scores` e `self._score_order`: pontuação máxima de cada item e
+          ordem de avaliação decrescente, usadas na poda de extrair_sabor
+
+        Parameters
+        ----------
+        index : list[dict]
+            Índice de sabores gerado por build_flavor_index.
+        """
+        # Cada keyword recebe um bit; a máscara do produto é o OR dos bits de suas keywords
+        self._keyword_bits: dict[str, int] = {}
+        keyword_masks: list[int] = []
+        for item in index:
+            mask: int = 0
+            for kw in item['keywords']:
+                if kw not in self._keyword_bits:
+                    self._keyword_bits[kw] = 1 << len(self._keyword_bits)
+                mask |= self._keyword_bits[kw]
+            keyword_masks.append(mask)
+
+        # Autômato Aho–Corasick: encontra todas as phrases em uma única passada pelo texto
+        self._phrase_automaton: ahocorasick.Automaton | None = None
+        phrase_items: dict[str, list[int]] = {}
+        for i, item in enumerate(index):
+            if item['phrase']:
+                phrase_items.setdefault(item['phrase'], []).append(i)
+        if ahocorasick is not None and phrase_items:
+            self._phrase_automaton = ahocorasick.Automaton()
+            for phrase, items in phrase_items.items():
+                self._phrase_automaton.add_word(phrase, tuple(items))
+            self._phrase_automaton.make_automaton()
+
+        # Campos em sequências paralelas (SoA), percorridas pelo laço de extrair_sabor
+        self._originals: tuple[str, ...] = tuple(item['original'] for item in index)
+        self._phrases: tuple[str, ...] = tuple(item['phrase'] for item in index)
+        self._keyword_masks: tuple[int, ...] = tuple(keyword_masks)
+
+        # Pontuação máxima de cada item e ordem de avaliação (maior primeiro) para a poda
+        self._max_scores: tuple[int, ...] = tuple(
+            len(phrase) + mask.bit_count() * _KEYWORD_WEIGHT
+            for phrase, mask in zip(self._phrases, self._keyword_masks)
+        )
+        self._score_order: tuple[int, ...] = tuple(
+            sorted(range(len(index)), key=lambda i: -self._max_scores[i])
+        )
+
+    def match_phrases(self, text_norm: str) -> set[int]:
+        """Retorna as posições no índice de sabores cujas phrases aparecem no texto.
+
+        Usa o autômato Aho–Corasick quando disponível; caso contrário, testa cada
+        phrase como substring do texto.
+
+        Parameters
+        ----------
+        text_norm : str
+            Texto já normalizado.
+
+        Returns
+        -------
+        set[int]
+            Índices dos itens de `flavor_index` cuja 'phrase' ocorre em `text_norm`.
+        """
+        if self._phrase_automaton is not None:
+            return {
+                i for _, items in self._phrase_automaton.iter(text_norm) for i in items
+            }
+        return {
+            i
+            for i, phrase in enumerate(self._phrases)
+            if phrase and phrase in text_norm
+        }
+
     # ----------------------------
     # Extração de entidades (pedido)
     # ----------------------------
@@ -275,14 +557,15 @@ class ChatbotVoRomario:
         int | None
             Quantidade encontrada ou None se não houver indicação.
         """
-        # Dúzias
-        if re.search(r'\bmeia\s+d[uú]zia\b', text_norm):
+        # Dúzias ("dúzia" já chega sem acento); os espaços nas pontas delimitam as palavras
+        padded: str = ' ' + ' '.join(text_norm.split()) + ' '
+        if ' meia duzia ' in padded:
             return 6
-        if re.search(r'\b(um|uma)\s+d[uú]zia\b', text_norm):
+        if ' uma duzia ' in padded or ' um duzia ' in padded:
             return 12
 
         # Dígitos
-        m = re.search(r'\b(\d{1,2})\b', text_norm)  # Busca números de 1 ou 2 dígitos
+        m = _search_digits(text_norm)  # Busca números de 1 ou 2 dígitos
         if m:
             try:
                 return int(m.group(1))
@@ -290,35 +573,10 @@ class ChatbotVoRomario:
                 pass
 
         # Números por extenso
-        num_words = {
-            'um': 1,
-            'uma': 1,
-            'dois': 2,
-            'duas': 2,
-            'tres': 3,
-            'quatro': 4,
-            'cinco': 5,
-            'seis': 6,
-            'sete': 7,
-            'oito': 8,
-            'nove': 9,
-            'dez': 10,
-            'onze': 11,
-            'doze': 12,
-            'treze': 13,
-            'quatorze': 14,
-            'catore': 14,
-            'quinze': 15,
-            'dezesseis': 16,
-            'dezessete': 17,
-            'dezoito': 18,
-            'dezenove': 19,
-            'vinte': 20,
-        }
         # TODO Fazer busca valores com mais de uma palavra, por exemplo: "vinte e dois".
-        for w, n in num_words.items():
-            if re.search(fr'\b{w}\b', text_norm):
-                return n
+        m = _search_num_words(text_norm)
+        if m:
+            return _NUM_WORDS[m.group(1)]
         return None
 
     def extrair_sabor(self, text_norm: str) -> dict | None:
@@ -329,6 +587,9 @@ class ChatbotVoRomario:
         - ocorrência direta da 'phrase' no texto
         - número de keywords em comum (peso aplicado)
 
+        Os itens são avaliados em ordem decrescente de pontuação máxima possível,
+        interrompendo a busca quando nenhum item restante pode superar o melhor.
+
         Parameters
         ----------
         text_norm : str
@@ -340,37 +601,59 @@ class ChatbotVoRomario:
             Se encontrado, retorna {'produto': nome_exibido, 'sabor': frase_normalizada}.
             Caso contrário, retorna None.
         """
-        tokens: set[str] = set(re.findall(r'\w+', text_norm))
-        best: None | dict = None
+        tokens: set[str] = set(text_norm.split())
+        user_mask: int = 0
+        for t in tokens:
+            user_mask |= self._keyword_bits.get(t, 0)
+
+        matched_phrases: set[int] = self.match_phrases(text_norm)
+        if not user_mask and not matched_phrases:
+            return None  # Nenhum sinal de sabor no texto (ex.: "oi", "tchau")
+
+        # Variáveis locais evitam buscar os atributos a cada iteração
+        phrases: tuple[str, ...] = self._phrases
+        keyword_masks: tuple[int, ...] = self._keyword_masks
+        max_scores: tuple[int, ...] = self._max_scores
+
+        best: int = -1
         best_score: int = 0
 
-        for item in self.flavor_index:
+        for i in self._score_order:
+            # Itens em ordem decrescente de pontuação máxima: nenhum dos restantes
+            # consegue superar (nem empatar com) o melhor encontrado
+            if max_scores[i] < best_score:
+                break
+
             score: int = 0
 
             # Pontos por "frase" aparecer como substring
-            if item['phrase'] and item['phrase'] in text_norm:
-                score += len(item['phrase'])
+            if i in matched_phrases:
+                score += len(phrases[i])
 
             # Pontos por keywords encontradas nos tokens do usuário
-            if item['keywords']:
-                # TODO 3 é o melhor fator a ser utilizado?
-                score += len(item['keywords'] & tokens) * 3
+            keyword_mask: int = keyword_masks[i]
+            if keyword_mask:
+                score += (keyword_mask & user_mask).bit_count() * _KEYWORD_WEIGHT
 
-            if score > best_score:
+            # Em caso de empate, vence o item que aparece primeiro no menu
+            if score > best_score or (score == best_score and i < best):
                 best_score = score
-                best = item
+                best = i
 
-        if best and best_score > 0:
-            return {'produto': best['original'], 'sabor': best['phrase']}
+        if best_score > 0:
+            return {'produto': self._originals[best], 'sabor': phrases[best]}
         return None
 
-    def extrair_pedido(self, frase: str) -> dict | None:
+    def extrair_pedido(self, frase: str, text_norm: str | None = None) -> dict | None:
         """Extrai um pedido (quantidade e/ou sabor) de uma frase livre.
 
         Parameters
         ----------
         frase : str
             Frase original do usuário.
+        text_norm : str | None, optional
+            Frase já normalizada, quando o chamador já a tiver calculado; por padrão
+            a frase é normalizada aqui.
 
         Returns
         -------
@@ -378,7 +661,8 @@ class ChatbotVoRomario:
             Dicionário com chaves possíveis: 'quantidade', 'produto', 'sabor'.
             Retorna None se não for possível extrair quantidade nem sabor.
         """
-        text_norm: str = self.normalize(frase)
+        if text_norm is None:
+            text_norm = self.normalize(frase)
 
         qtd: int | None = self.extrair_quantidade(text_norm)
         sabor_info: dict | None = self.extrair_sabor(text_norm)
@@ -397,12 +681,12 @@ class ChatbotVoRomario:
     # Fluxo de conversa
     # ----------------------------
     def bot_presentation(self) -> None:
-        """Exibe a mensagem de apresentação do bot na inicialização."""
-        presetation_intent = next(i for i in self.intents if i['tag'] == 'apresentacao')
+        """Exibe a mensagem de apresentação do bot no início da conversa."""
+        presetation_intent = self._intents_by_tag['apresentacao']
         print('🤖: ' + random.choice(presetation_intent['responses']))
 
     # TODO Valide esse método
-    def buy_request(self, user_input: str) -> str:
+    def buy_request(self, user_input: str, text_norm: str | None = None) -> str:
         """Processa um pedido quando o usuário demonstra intenção de comprar.
 
         Extrai quantidade e sabor a partir do texto; atualiza o contexto com o
@@ -412,13 +696,15 @@ class ChatbotVoRomario:
         ----------
         user_input : str
             Texto do usuário contendo o pedido.
+        text_norm : str | None, optional
+            Texto do usuário já normalizado, repassado para extrair_pedido.
 
         Returns
         -------
         str
             Mensagem de retorno do bot (pede esclarecimento se necessário ou confirma o pedido).
         """
-        pedido: dict | None = self.extrair_pedido(user_input)
+        pedido: dict | None = self.extrair_pedido(user_input, text_norm)
 
         if not pedido:
             return 'Entendi que você quer comprar. Pode me dizer a **quantidade** e o **sabor**? 🙂'
@@ -434,7 +720,9 @@ class ChatbotVoRomario:
         """Gera uma resposta com base nas intents e no contexto atual.
 
         O método pré-processa a entrada do usuário, tenta casar com intents
-        (respeitando filtros de contexto) e retorna uma resposta formatada.
+        (respeitando filtros de contexto) e retorna uma resposta formatada. Apenas
+        as intents que compartilham algum token com a entrada (via índice invertido)
+        são avaliadas, na ordem em que aparecem no arquivo de intents.
 
         Parameters
         ----------
@@ -446,29 +734,32 @@ class ChatbotVoRomario:
         str
             Resposta selecionada (ou mensagem padrão se não houver correspondência).
         """
-        processed_input: list[str] = self.preprocess_text(user_input)
-
-        for intent in self.intents:
+        # Normaliza uma única vez por mensagem; o resultado é reaproveitado abaixo
+        text_norm: str = self.normalize(user_input)
+        processed_input: set[str] = set(self._tokens_from_norm(text_norm))
+
+        # Apenas intents com algum token em comum, na ordem original do arquivo
+        candidates: set[int] = set()
+        for word in processed_input:
+            candidates.update(self._token_to_intents.get(word, ()))
+        for i in sorted(candidates):
+            intent: dict = self.intents[i]
             if intent.get('context_filter') and not all(
                 self.context.get(c) for c in intent['context_filter']
             ):
                 continue  # Pula intents com contexto não satisfeito
 
-            if any(
-                word in processed_input
-                for word in self.preprocess_text(' '.join(intent.get('patterns', [])))
-            ):
-                if intent.get('context_set'):
-                    self.context = {k: True for k in intent['context_set']}
+            if intent.get('context_set'):
+                self.context = {k: True for k in intent['context_set']}
 
-                if self.context.get('comprar'):
-                    # TODO Construa esse código
-                    print(self.flavor_index)
-                    # self.build_flavor_index()
-                    # return self.buy_request(user_input)
+            if self.context.get('comprar'):
+                # TODO Construa esse código
+                print(self.flavor_index)
+                # self.build_flavor_index()
+                # return self.buy_request(user_input, text_norm)
 
-                response: str = random.choice(intent['responses'])
-                return response.format(**self.data)
+            response, has_fields = random.choice(self._responses_parsed[i])
+            return response.format_map(self.data) if has_fields else response
 
         return 'Desculpe, não entendi.'
 
@@ -476,6 +767,7 @@ class ChatbotVoRomario:
 def main() -> None:
     """Ponto de entrada do programa: inicializa o bot e interage em loop com o usuário."""
     bot: ChatbotVoRomario = ChatbotVoRomario()
+    bot.bot_presentation()
 
     while not bot.context.get('desligar'):
         user_input: str = input('Você: ')
@@ -1,29 +1,36 @@
 """Module that executes code standardization and functionality tests."""
 
-from subprocess import run
-from sys import argv, exit
+from concurrent.futures import ThreadPoolExecutor
+from subprocess import CompletedProcess, run
+from sys import argv, exit, stderr, stdout
 
 
 def run_checks(target: str) -> None:
-    """Execute all code checks internally in sequence.
+    """Execute all code checks internally.
 
-    Order: isort → black → pydocstyle → doctest → mypy → pytest
+    Order: isort → black, then pydocstyle, doctest, mypy and pytest in parallel.
+
+    The formatters rewrite files, so they run sequentially before anything else.
+    The remaining checks only read the code and run concurrently; their output is
+    printed in the order above once all of them finish.
 
     Parameters
     ----------
     target : str
         The target file or directory.
     """
-    commands = [
+    format_commands = [
         ['isort', '--only-modified', '--profile', 'black', target],
         ['black', '--skip-string-normalization', target],
+    ]
+    check_commands = [
         ['pydocstyle', target],
         ['python', '-m', 'doctest', target],
         ['mypy', '--namespace-packages', '--explicit-package-bases', target],
         ['pytest', '--verbose'],
     ]
 
-    for command in commands:
+    for command in format_commands:
         result = run(command)
         if result.returncode != 0:
             print(
@@ -31,6 +38,29 @@ def run_checks(target: str) -> None:
             )
             exit(result.returncode)
 
+    # Each worker thread only waits on its subprocess, so threads are enough here
+    with ThreadPoolExecutor(max_workers=len(check_commands)) as executor:
+        results: list[CompletedProcess[str]] = list(
+            executor.map(
+                lambda command: run(command, capture_output=True, text=True),
+                check_commands,
+            )
+        )
+
+    returncode = 0
+    for command, check_result in zip(check_commands, results):
+        stdout.write(check_result.stdout)
+        stderr.write(check_result.stderr)
+        if check_result.returncode != 0:
+            print(
+                f'Command {' '.join(command)} failed with exit code '
+                f'{check_result.returncode}'
+            )
+            returncode = returncode or check_result.returncode
+
+    if returncode != 0:
+        exit(returncode)
+
 
 if __name__ == '__main__':
     target = argv[1] if len(argv) > 1 else '.'